@@ -3,6 +3,8 @@
 import logging
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import click
 import nbformat
 
@@ -46,7 +48,9 @@ NOTEBOOKS_NO_EXECUTION = [
 ]
 
 
-def comment_install_cells(notebook: nbformat.NotebookNode) -> nbformat.NotebookNode:
+def comment_install_cells(notebook: nbformat.NotebookNode) -> bool:
+    """Comment out cells containing "pip install", in place. Returns whether any cell was changed."""
+    changed = False
     for cell in notebook.cells:
         if cell.cell_type != "code":
             continue
@@ -57,8 +61,9 @@ def comment_install_cells(notebook: nbformat.NotebookNode) -> nbformat.NotebookN
                 f"# {line}" if line.strip() else line
                 for line in cell.source.splitlines()
             )
+            changed = True
 
-    return notebook
+    return changed
 
 
 def is_magic_command(code: str) -> bool:
@@ -82,10 +87,11 @@ def has_blocklisted_command(code: str, metadata: dict) -> bool:
 
 def add_vcr_to_notebook(
     notebook: nbformat.NotebookNode, cassette_prefix: str
-) -> nbformat.NotebookNode:
-    """Inject `with vcr.cassette` into each code cell of the notebook."""
+) -> bool:
+    """Inject `with vcr.cassette` into each code cell of the notebook, in place. Returns whether any cell was wrapped."""
 
     # Inject VCR context manager into each code cell
+    wrapped = False
     for idx, cell in enumerate(notebook.cells):
         if cell.cell_type != "code":
             continue
@@ -118,6 +124,11 @@ def add_vcr_to_notebook(
         cell.source = f"with custom_vcr.use_cassette('{cassette_name}', filter_headers=['x-api-key', 'authorization'], record_mode='once', serializer='advanced_compressed'):\n" + "\n".join(
             f"    {line}" for line in lines
         )
+        wrapped = True
+
+    # no cell records a cassette, so the notebook doesn't need vcr set up
+    if not wrapped:
+        return False
 
     # Add import statement
     vcr_import_lines = [
@@ -154,46 +165,67 @@ def add_vcr_to_notebook(
     import_cell = nbformat.v4.new_code_cell(source="\n".join(vcr_import_lines))
     import_cell.pop("id", None)
     notebook.cells.insert(0, import_cell)
-    return notebook
+    return True
+
+
+def process_notebook(notebook_path: str, should_comment_install_cells: bool) -> None:
+    try:
+        notebook = nbformat.read(notebook_path, as_version=4)
+        changed = False
+
+        if should_comment_install_cells:
+            changed = comment_install_cells(notebook)
+
+        base_filename = os.path.splitext(os.path.basename(notebook_path))[0]
+        cassette_prefix = os.path.join(CASSETTES_PATH, base_filename)
+        if notebook_path not in NOTEBOOKS_NO_CASSETTES:
+            if add_vcr_to_notebook(notebook, cassette_prefix=cassette_prefix):
+                changed = True
+
+        if notebook_path in NOTEBOOKS_NO_EXECUTION:
+            # Add a cell at the beginning to indicate that this notebook should not be executed
+            warning_cell = nbformat.v4.new_markdown_cell(
+                source="**Warning:** This notebook is not meant to be executed automatically."
+            )
+            notebook.cells.insert(0, warning_cell)
+
+            # Add a special tag to the first code cell
+            if notebook.cells and notebook.cells[1].cell_type == "code":
+                notebook.cells[1].metadata["tags"] = notebook.cells[1].metadata.get("tags", []) + ["no_execution"]
+            changed = True
+
+        # leave unchanged notebooks (and their mtimes) untouched
+        if not changed:
+            return
+
+        nbformat.write(notebook, notebook_path)
+        logger.info(f"Processed: {notebook_path}")
+    except Exception as e:
+        logger.error(f"Error processing {notebook_path}: {e}")
 
 
 def process_notebooks(should_comment_install_cells: bool) -> None:
-    for directory in NOTEBOOK_DIRS:
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if not file.endswith(".ipynb") or "ipynb_checkpoints" in root:
-                    continue
-
-                notebook_path = os.path.join(root, file)
-                try:
-                    notebook = nbformat.read(notebook_path, as_version=4)
-
-                    if should_comment_install_cells:
-                        notebook = comment_install_cells(notebook)
-
-                    base_filename = os.path.splitext(os.path.basename(file))[0]
-                    cassette_prefix = os.path.join(CASSETTES_PATH, base_filename)
-                    if notebook_path not in NOTEBOOKS_NO_CASSETTES:
-                        notebook = add_vcr_to_notebook(
-                            notebook, cassette_prefix=cassette_prefix
-                        )
-
-                    if notebook_path in NOTEBOOKS_NO_EXECUTION:
-                        # Add a cell at the beginning to indicate that this notebook should not be executed
-                        warning_cell = nbformat.v4.new_markdown_cell(
-                            source="**Warning:** This notebook is not meant to be executed automatically."
-                        )
-                        notebook.cells.insert(0, warning_cell)
-
-                        # Add a special tag to the first code cell
-                        if notebook.cells and notebook.cells[1].cell_type == "code":
-                            notebook.cells[1].metadata["tags"] = notebook.cells[1].metadata.get("tags", []) + ["no_execution"]
-
-                    nbformat.write(notebook, notebook_path)
-                    logger.info(f"Processed: {notebook_path}")
-                except Exception as e:
-                    logger.error(f"Error processing {notebook_path}: {e}")
-    
+    notebook_paths = [
+        os.path.join(root, file)
+        for directory in NOTEBOOK_DIRS
+        for root, _, files in os.walk(directory)
+        if "ipynb_checkpoints" not in root
+        for file in files
+        if file.endswith(".ipynb")
+    ]
+    # notebooks are independent of each other, so process them in parallel
+    with ProcessPoolExecutor() as executor:
+        list(
+            executor.map(
+                partial(
+                    process_notebook,
+                    should_comment_install_cells=should_comment_install_cells,
+                ),
+                notebook_paths,
+                chunksize=8,
+            )
+        )
+
     with open(os.path.join(DOCS_PATH, "notebooks_no_execution.json"), "w") as f:
         json.dump(NOTEBOOKS_NO_EXECUTION, f)
 
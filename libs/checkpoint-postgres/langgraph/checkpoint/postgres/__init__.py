@@ -1,6 +1,6 @@
 import threading
 from contextlib import contextmanager
-from typing import Any, Iterator, Optional, Sequence, Union
+from typing import Any, Iterator, List, Optional, Sequence, Union
 
 from langchain_core.runnables import RunnableConfig
 from psycopg import Connection, Cursor, Pipeline
@@ -299,7 +299,6 @@ class PostgresSaver(BasePostgresSaver):
             "checkpoint_id", configurable.pop("thread_ts", None)
         )
 
-        copy = checkpoint.copy()
         next_config = {
             "configurable": {
                 "thread_id": thread_id,
@@ -314,7 +313,7 @@ class PostgresSaver(BasePostgresSaver):
                 self._dump_blobs(
                     thread_id,
                     checkpoint_ns,
-                    copy.pop("channel_values"),  # type: ignore[misc]
+                    checkpoint["channel_values"],
                     new_versions,
                 ),
             )
@@ -325,12 +324,36 @@ class PostgresSaver(BasePostgresSaver):
                     checkpoint_ns,
                     checkpoint["id"],
                     checkpoint_id,
-                    Jsonb(self._dump_checkpoint(copy)),
+                    Jsonb(self._dump_checkpoint(checkpoint)),
                     self._dump_metadata(metadata),
                 ),
             )
         return next_config
 
+    def put_many(
+        self,
+        items: Sequence[
+            tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]
+        ],
+    ) -> List[RunnableConfig]:
+        """Save multiple checkpoints to the database in a single batch.
+
+        This is equivalent to calling `put()` once per item, but the channel blobs and
+        the checkpoints of all items are each written with a single `executemany` call
+        in pipeline mode.
+
+        Args:
+            items (Sequence[Tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]]): The (config, checkpoint, metadata, new_versions) arguments of each `put()` call.
+
+        Returns:
+            List[RunnableConfig]: Updated configurations, one per stored checkpoint.
+        """
+        blobs, checkpoints, next_configs = self._dump_puts(items)
+        with self._cursor(pipeline=True) as cur:
+            cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+            cur.executemany(self.UPSERT_CHECKPOINTS_SQL, checkpoints)
+        return next_configs
+
     def put_writes(
         self,
         config: RunnableConfig,
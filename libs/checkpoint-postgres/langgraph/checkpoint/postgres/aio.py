@@ -1,6 +1,6 @@
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Union
+from typing import Any, AsyncIterator, Iterator, List, Optional, Sequence, Union
 
 from langchain_core.runnables import RunnableConfig
 from psycopg import AsyncConnection, AsyncCursor, AsyncPipeline
@@ -17,7 +17,10 @@ from langgraph.checkpoint.base import (
     CheckpointTuple,
     get_checkpoint_id,
 )
-from langgraph.checkpoint.postgres.base import BasePostgresSaver
+from langgraph.checkpoint.postgres.base import (
+    CHECKPOINT_BLOBS_COPY_TYPES,
+    BasePostgresSaver,
+)
 from langgraph.checkpoint.serde.base import SerializerProtocol
 
 Conn = Union[AsyncConnection[DictRow], AsyncConnectionPool[AsyncConnection[DictRow]]]
@@ -140,33 +143,15 @@ class AsyncPostgresSaver(BasePostgresSaver):
         # if we change this to use .stream() we need to make sure to close the cursor
         async with self._cursor() as cur:
             await cur.execute(query, args, binary=True)
-            async for value in cur:
-                yield CheckpointTuple(
-                    {
-                        "configurable": {
-                            "thread_id": value["thread_id"],
-                            "checkpoint_ns": value["checkpoint_ns"],
-                            "checkpoint_id": value["checkpoint_id"],
-                        }
-                    },
-                    await asyncio.to_thread(
-                        self._load_checkpoint,
-                        value["checkpoint"],
-                        value["channel_values"],
-                        value["pending_sends"],
-                    ),
-                    self._load_metadata(value["metadata"]),
-                    {
-                        "configurable": {
-                            "thread_id": value["thread_id"],
-                            "checkpoint_ns": value["checkpoint_ns"],
-                            "checkpoint_id": value["parent_checkpoint_id"],
-                        }
-                    }
-                    if value["parent_checkpoint_id"]
-                    else None,
-                    await asyncio.to_thread(self._load_writes, value["pending_writes"]),
-                )
+            # deserialize rows concurrently, a batch at a time, yielding in order
+            while values := await cur.fetchmany(32):
+                for checkpoint_tuple in await asyncio.gather(
+                    *(
+                        asyncio.to_thread(self._load_checkpoint_tuple, value)
+                        for value in values
+                    )
+                ):
+                    yield checkpoint_tuple
 
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
@@ -255,7 +240,6 @@ class AsyncPostgresSaver(BasePostgresSaver):
             "checkpoint_id", configurable.pop("thread_ts", None)
         )
 
-        copy = checkpoint.copy()
         next_config = {
             "configurable": {
                 "thread_id": thread_id,
@@ -264,30 +248,58 @@ class AsyncPostgresSaver(BasePostgresSaver):
             }
         }
 
-        async with self._cursor(pipeline=True) as cur:
-            await cur.executemany(
-                self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                await asyncio.to_thread(
-                    self._dump_blobs,
-                    thread_id,
-                    checkpoint_ns,
-                    copy.pop("channel_values"),  # type: ignore[misc]
-                    new_versions,
-                ),
-            )
-            await cur.execute(
-                self.UPSERT_CHECKPOINTS_SQL,
-                (
-                    thread_id,
-                    checkpoint_ns,
-                    checkpoint["id"],
-                    checkpoint_id,
-                    Jsonb(self._dump_checkpoint(copy)),
-                    self._dump_metadata(metadata),
-                ),
-            )
+        blobs = await asyncio.to_thread(
+            self._dump_blobs,
+            thread_id,
+            checkpoint_ns,
+            checkpoint["channel_values"],
+            new_versions,
+        )
+        params = (
+            thread_id,
+            checkpoint_ns,
+            checkpoint["id"],
+            checkpoint_id,
+            Jsonb(self._dump_checkpoint(checkpoint)),
+            self._dump_metadata(metadata),
+        )
+        if self.pipe is None and len(blobs) >= self.copy_blobs_threshold:
+            # COPY is not supported in pipeline mode
+            async with self._cursor() as cur, cur.connection.transaction():
+                await self._copy_blobs(cur, blobs)
+                await cur.execute(self.UPSERT_CHECKPOINTS_SQL, params)
+        else:
+            async with self._cursor(pipeline=True) as cur:
+                await cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+                await cur.execute(self.UPSERT_CHECKPOINTS_SQL, params)
         return next_config
 
+    async def aput_many(
+        self,
+        items: Sequence[
+            tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]
+        ],
+    ) -> List[RunnableConfig]:
+        """Save multiple checkpoints to the database in a single batch asynchronously.
+
+        This is equivalent to calling `aput()` once per item, but the channel blobs and
+        the checkpoints of all items are each written with a single `executemany` call
+        in pipeline mode.
+
+        Args:
+            items (Sequence[Tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]]): The (config, checkpoint, metadata, new_versions) arguments of each `aput()` call.
+
+        Returns:
+            List[RunnableConfig]: Updated configurations, one per stored checkpoint.
+        """
+        blobs, checkpoints, next_configs = await asyncio.to_thread(
+            self._dump_puts, items
+        )
+        async with self._cursor(pipeline=True) as cur:
+            await cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+            await cur.executemany(self.UPSERT_CHECKPOINTS_SQL, checkpoints)
+        return next_configs
+
     async def aput_writes(
         self,
         config: RunnableConfig,
@@ -319,6 +331,41 @@ class AsyncPostgresSaver(BasePostgresSaver):
         async with self._cursor(pipeline=True) as cur:
             await cur.executemany(query, params)
 
+    async def _copy_blobs(self, cur: AsyncCursor[DictRow], blobs: list[tuple]) -> None:
+        await cur.execute(self.CREATE_CHECKPOINT_BLOBS_COPY_SQL)
+        async with cur.copy(self.COPY_CHECKPOINT_BLOBS_SQL) as copy:
+            copy.set_types(CHECKPOINT_BLOBS_COPY_TYPES)
+            for row in blobs:
+                await copy.write_row(row)
+        await cur.execute(self.INSERT_CHECKPOINT_BLOBS_FROM_COPY_SQL)
+
+    def _load_checkpoint_tuple(self, value: DictRow) -> CheckpointTuple:
+        return CheckpointTuple(
+            {
+                "configurable": {
+                    "thread_id": value["thread_id"],
+                    "checkpoint_ns": value["checkpoint_ns"],
+                    "checkpoint_id": value["checkpoint_id"],
+                }
+            },
+            self._load_checkpoint(
+                value["checkpoint"],
+                value["channel_values"],
+                value["pending_sends"],
+            ),
+            self._load_metadata(value["metadata"]),
+            {
+                "configurable": {
+                    "thread_id": value["thread_id"],
+                    "checkpoint_ns": value["checkpoint_ns"],
+                    "checkpoint_id": value["parent_checkpoint_id"],
+                }
+            }
+            if value["parent_checkpoint_id"]
+            else None,
+            self._load_writes(value["pending_writes"]),
+        )
+
     @asynccontextmanager
     async def _cursor(
         self, *, pipeline: bool = False
@@ -123,6 +123,26 @@ INSERT_CHECKPOINT_WRITES_SQL = """
     ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) DO NOTHING
 """
 
+# COPY can't express ON CONFLICT, so large batches of blobs are copied into
+# a temporary table and moved into checkpoint_blobs from there
+CREATE_CHECKPOINT_BLOBS_COPY_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS checkpoint_blobs_copy
+    (LIKE checkpoint_blobs) ON COMMIT DELETE ROWS
+"""
+
+COPY_CHECKPOINT_BLOBS_SQL = """
+    COPY checkpoint_blobs_copy (thread_id, checkpoint_ns, channel, version, type, blob)
+    FROM STDIN WITH (FORMAT BINARY)
+"""
+
+INSERT_CHECKPOINT_BLOBS_FROM_COPY_SQL = """
+    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
+    SELECT thread_id, checkpoint_ns, channel, version, type, blob FROM checkpoint_blobs_copy
+    ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
+"""
+
+CHECKPOINT_BLOBS_COPY_TYPES = ["text", "text", "text", "text", "text", "bytea"]
+
 
 class BasePostgresSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
@@ -131,6 +151,12 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
     UPSERT_CHECKPOINT_WRITES_SQL = UPSERT_CHECKPOINT_WRITES_SQL
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
+    CREATE_CHECKPOINT_BLOBS_COPY_SQL = CREATE_CHECKPOINT_BLOBS_COPY_SQL
+    COPY_CHECKPOINT_BLOBS_SQL = COPY_CHECKPOINT_BLOBS_SQL
+    INSERT_CHECKPOINT_BLOBS_FROM_COPY_SQL = INSERT_CHECKPOINT_BLOBS_FROM_COPY_SQL
+
+    # minimum number of blobs in a single put for them to be written with COPY
+    copy_blobs_threshold = 16
 
     jsonplus_serde = JsonPlusSerializer()
 
@@ -143,23 +169,29 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         return {
             **checkpoint,
             "pending_sends": [
-                self.serde.loads_typed((c.decode(), b)) for c, b in pending_sends or []
-            ],
+                self.serde.loads_typed((c.decode(), b)) for c, b in pending_sends
+            ]
+            if pending_sends
+            else [],
             "channel_values": self._load_blobs(channel_values),
         }
 
     def _dump_checkpoint(self, checkpoint: Checkpoint) -> dict[str, Any]:
-        return {**checkpoint, "pending_sends": []}
+        # channel values are stored separately, in checkpoint_blobs
+        dumped = {**checkpoint, "pending_sends": []}
+        dumped.pop("channel_values", None)
+        return dumped
 
     def _load_blobs(
         self, blob_values: list[tuple[bytes, bytes, bytes]]
     ) -> dict[str, Any]:
         if not blob_values:
             return {}
+        loads_typed = self.serde.loads_typed
         return {
-            k.decode(): self.serde.loads_typed((t.decode(), v))
+            k.decode(): loads_typed((t.decode(), v))
             for k, t, v in blob_values
-            if t.decode() != "empty"
+            if t != b"empty"
         }
 
     def _dump_blobs(
@@ -172,36 +204,26 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         if not versions:
             return []
 
+        # serialize all values in one pass, then zip them with the keys
+        keys, vers = zip(*versions.items())
+        dumps_typed = self.serde.dumps_typed
+        empty = ("empty", None)
+        dumped = [dumps_typed(values[k]) if k in values else empty for k in keys]
         return [
-            (
-                thread_id,
-                checkpoint_ns,
-                k,
-                cast(str, ver),
-                *(
-                    self.serde.dumps_typed(values[k])
-                    if k in values
-                    else ("empty", None)
-                ),
-            )
-            for k, ver in versions.items()
+            (thread_id, checkpoint_ns, k, cast(str, ver), type_, blob)
+            for k, ver, (type_, blob) in zip(keys, vers, dumped)
         ]
 
     def _load_writes(
         self, writes: list[tuple[bytes, bytes, bytes, bytes]]
     ) -> list[tuple[str, str, Any]]:
-        return (
-            [
-                (
-                    tid.decode(),
-                    channel.decode(),
-                    self.serde.loads_typed((t.decode(), v)),
-                )
-                for tid, channel, t, v in writes
-            ]
-            if writes
-            else []
-        )
+        if not writes:
+            return []
+        loads_typed = self.serde.loads_typed
+        return [
+            (tid.decode(), channel.decode(), loads_typed((t.decode(), v)))
+            for tid, channel, t, v in writes
+        ]
 
     def _dump_writes(
         self,
@@ -211,6 +233,9 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         task_id: str,
         writes: Sequence[tuple[str, Any]],
     ) -> list[tuple[str, str, str, str, int, str, str, bytes]]:
+        # serialize all values in one pass, then zip them with the channels
+        dumps_typed = self.serde.dumps_typed
+        dumped = [dumps_typed(value) for _, value in writes]
         return [
             (
                 thread_id,
@@ -219,11 +244,58 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
                 task_id,
                 WRITES_IDX_MAP.get(channel, idx),
                 channel,
-                *self.serde.dumps_typed(value),
+                type_,
+                blob,
             )
-            for idx, (channel, value) in enumerate(writes)
+            for idx, ((channel, _), (type_, blob)) in enumerate(zip(writes, dumped))
         ]
 
+    def _dump_puts(
+        self,
+        items: Sequence[
+            tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]
+        ],
+    ) -> tuple[list[tuple], list[tuple], list[RunnableConfig]]:
+        """Prepare the blob rows, checkpoint rows and next configs for `put_many`."""
+        blobs: list[tuple] = []
+        checkpoints: list[tuple] = []
+        next_configs: list[RunnableConfig] = []
+        for config, checkpoint, metadata, new_versions in items:
+            configurable = config["configurable"].copy()
+            thread_id = configurable.pop("thread_id")
+            checkpoint_ns = configurable.pop("checkpoint_ns")
+            checkpoint_id = configurable.pop(
+                "checkpoint_id", configurable.pop("thread_ts", None)
+            )
+            blobs.extend(
+                self._dump_blobs(
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["channel_values"],
+                    new_versions,
+                )
+            )
+            checkpoints.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    checkpoint_id,
+                    Jsonb(self._dump_checkpoint(checkpoint)),
+                    self._dump_metadata(metadata),
+                )
+            )
+            next_configs.append(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint["id"],
+                    }
+                }
+            )
+        return blobs, checkpoints, next_configs
+
     def _load_metadata(self, metadata: dict[str, Any]) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(self.jsonplus_serde.dumps(metadata))
 
@@ -111,3 +111,22 @@ class TestAsyncPostgresSaver:
             assert [c async for c in saver.alist(None, filter={"my_key": "abc"})][
                 0
             ].metadata["my_key"] == "abc"
+
+    async def test_put_copy_blobs(self) -> None:
+        async with AsyncPostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            channels = [f"channel-{i}" for i in range(saver.copy_blobs_threshold)]
+            checkpoint: Checkpoint = {
+                **self.chkpnt_1,
+                "channel_values": {c: i for i, c in enumerate(channels)},
+                "channel_versions": {c: "1" for c in channels},
+            }
+            config = await saver.aput(
+                self.config_1, checkpoint, self.metadata_1, {c: "1" for c in channels}
+            )
+            # writing the same blobs again must not conflict
+            await saver.aput(
+                self.config_1, checkpoint, self.metadata_1, {c: "1" for c in channels}
+            )
+            tup = await saver.aget_tuple(config)
+            assert tup is not None
+            assert tup.checkpoint["channel_values"] == checkpoint["channel_values"]
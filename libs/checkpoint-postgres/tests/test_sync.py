@@ -110,3 +110,20 @@ class TestPostgresSaver:
                 list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]  # type: ignore
                 == "abc"
             )
+
+    def test_put_many(self) -> None:
+        with PostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            configs = saver.put_many(
+                [
+                    (self.config_1, self.chkpnt_1, self.metadata_1, {}),
+                    (self.config_2, self.chkpnt_2, self.metadata_2, {}),
+                    (self.config_3, self.chkpnt_3, self.metadata_3, {}),
+                ]
+            )
+            assert [c["configurable"]["checkpoint_id"] for c in configs] == [
+                self.chkpnt_1["id"],
+                self.chkpnt_2["id"],
+                self.chkpnt_3["id"],
+            ]
+            assert len(list(saver.list(None))) == 3
+            assert saver.get_tuple(configs[1]).metadata == self.metadata_2  # type: ignore
@@ -1,8 +1,20 @@
+import json
+import queue
 import random
 import sqlite3
 import threading
-from contextlib import closing, contextmanager
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+from concurrent.futures import Future
+from contextlib import ExitStack, closing, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -18,7 +30,15 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INSERT_WRITES_SQL,
+    SELECT_CHECKPOINT_SQL,
+    SELECT_LATEST_CHECKPOINT_SQL,
+    SELECT_WRITES_SQL,
+    UPSERT_CHECKPOINT_SQL,
+    UPSERT_WRITES_SQL,
+    search_where,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -30,20 +50,65 @@ _AIO_ERROR_MSG = (
     "for more information."
 )
 
+# Per-connection tuning, safe to use together with WAL mode (set in `setup()`).
+_CONN_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=10737418240;
+PRAGMA cache_size=-65536;
+PRAGMA journal_size_limit=33554432;
+"""
+
+
+def _connect_reader(conn_string: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(conn_string, check_same_thread=False)
+    conn.executescript(_CONN_PRAGMAS + "PRAGMA query_only=1;")
+    return conn
+
+
+def _checkpoint_json(
+    obj: Optional[bytes],
+    thread_id: str,
+    checkpoint_ns: str,
+    checkpoint_id: str,
+    parent_checkpoint_id: Optional[str],
+    metadata: Optional[bytes],
+) -> bytes:
+    if obj is not None:
+        return obj
+    return json.dumps(
+        {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+            "parent_checkpoint_id": parent_checkpoint_id,
+            "metadata": json.loads(metadata) if metadata is not None else None,
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+# Number of rows `list()` fetches from its cursor at a time.
+_LIST_PAGE_SIZE = 128
+
 
 class SqliteSaver(BaseCheckpointSaver[str]):
     """A checkpoint saver that stores checkpoints in a SQLite database.
 
     Note:
-        This class is meant for lightweight, synchronous use cases
-        (demos and small projects) and does not
-        scale to multiple threads.
+        This class is meant for synchronous use cases. It can be shared between
+        threads: writes go through `conn` and are serialized by a lock, with writes
+        from concurrent threads committed together, while `get_tuple` and `list`
+        use the `readers` connections, if any, so that they don't wait for writes.
+        `from_conn_string` opens a pool of readers for on-disk databases, but not for
+        in-memory ones, where reads share `conn` and its lock.
         For a similar sqlite saver with `async` support,
         consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
 
     Args:
         conn (sqlite3.Connection): The SQLite database connection.
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to JsonPlusSerializerCompat.
+        readers (Optional[Sequence[sqlite3.Connection]]): Additional connections to the same database, used by `get_tuple` and `list` so that reads don't wait for writes on `conn`. Defaults to None, in which case reads also use `conn`.
 
     Examples:
 
@@ -67,26 +132,52 @@ class SqliteSaver(BaseCheckpointSaver[str]):
 
     conn: sqlite3.Connection
     is_setup: bool
+    readers: Optional["queue.Queue[sqlite3.Connection]"]
 
     def __init__(
         self,
         conn: sqlite3.Connection,
         *,
         serde: Optional[SerializerProtocol] = None,
+        readers: Optional[Sequence[sqlite3.Connection]] = None,
     ) -> None:
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
         self.conn = conn
+        if readers:
+            self.readers = queue.Queue()
+            for reader in readers:
+                self.readers.put(reader)
+        else:
+            self.readers = None
+        # set by `in_memory()` when the database is periodically copied to disk
+        self._flush_conn: Optional[sqlite3.Connection] = None
+        self._flush_every = 0
+        self._puts_since_flush = 0
         self.is_setup = False
         self.lock = threading.Lock()
+        # writes waiting to be committed, see `_write()`
+        self._pending_writes: queue.SimpleQueue[
+            Tuple[str, Sequence[Tuple[Any, ...]], Future]
+        ] = queue.SimpleQueue()
+        self.setup()
 
     @classmethod
     @contextmanager
-    def from_conn_string(cls, conn_string: str) -> Iterator["SqliteSaver"]:
+    def from_conn_string(
+        cls, conn_string: str, *, readers: int = 4
+    ) -> Iterator["SqliteSaver"]:
         """Create a new SqliteSaver instance from a connection string.
 
+        For on-disk databases, the connections are tuned for WAL mode (e.g. with
+        `synchronous=NORMAL` and memory-mapped I/O), and `readers` additional read-only
+        connections are opened for `get_tuple` and `list`. In WAL mode these can read
+        while `put` holds the write connection. Connections passed to `SqliteSaver`
+        directly are left as they are.
+
         Args:
             conn_string (str): The SQLite connection string.
+            readers (int): The number of read connections to open for on-disk databases. Defaults to 4.
 
         Yields:
             SqliteSaver: A new SqliteSaver instance.
@@ -103,27 +194,96 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 with SqliteSaver.from_conn_string("checkpoints.sqlite") as memory:
                     ...
         """
-        with closing(
-            sqlite3.connect(
-                conn_string,
-                # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
-                check_same_thread=False,
+        with ExitStack() as stack:
+            conn = stack.enter_context(
+                closing(
+                    sqlite3.connect(
+                        conn_string,
+                        # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
+                        check_same_thread=False,
+                        # take the write lock when the transaction starts, rather than
+                        # upgrading a read lock mid-transaction (which can fail with SQLITE_BUSY)
+                        isolation_level="IMMEDIATE",
+                        cached_statements=256,
+                    )
+                )
+            )
+            # in-memory and temporary databases are private to their connection
+            if conn_string in ("", ":memory:"):
+                reader_conns = []
+            else:
+                conn.executescript(_CONN_PRAGMAS)
+                reader_conns = [
+                    stack.enter_context(closing(_connect_reader(conn_string)))
+                    for _ in range(readers)
+                ]
+            yield SqliteSaver(conn, readers=reader_conns)
+
+    @classmethod
+    @contextmanager
+    def in_memory(
+        cls, flush_path: Optional[str] = None, *, flush_every: int = 1000
+    ) -> Iterator["SqliteSaver"]:
+        """Create a new SqliteSaver instance backed by an in-memory database.
+
+        Checkpoints are only written to memory, so saving them never touches the disk.
+        If `flush_path` is given, the database at that path is loaded on entry, and the
+        in-memory database is copied back to it every `flush_every` saved checkpoints
+        and on exit.
+
+        Args:
+            flush_path (Optional[str]): Path of the SQLite database to load from and flush to. Defaults to None.
+            flush_every (int): The number of saved checkpoints between flushes. Defaults to 1000.
+
+        Yields:
+            SqliteSaver: A new SqliteSaver instance.
+
+        Examples:
+
+                with SqliteSaver.in_memory("checkpoints.sqlite") as memory:
+                    ...
+        """
+        with ExitStack() as stack:
+            conn = stack.enter_context(
+                closing(
+                    sqlite3.connect(
+                        ":memory:", check_same_thread=False, cached_statements=256
+                    )
+                )
             )
-        ) as conn:
-            yield SqliteSaver(conn)
+            flush_conn = None
+            if flush_path is not None:
+                flush_conn = stack.enter_context(
+                    closing(sqlite3.connect(flush_path, check_same_thread=False))
+                )
+                flush_conn.backup(conn)
+            saver = SqliteSaver(conn)
+            saver._flush_conn = flush_conn
+            saver._flush_every = flush_every
+            # write the schema to disk right away
+            saver.flush()
+            try:
+                yield saver
+            finally:
+                saver.flush()
 
     def setup(self) -> None:
         """Set up the checkpoint database.
 
         This method creates the necessary tables in the SQLite database if they don't
-        already exist. It is called automatically when needed and should not be called
-        directly by the user.
+        already exist. It is called automatically when the saver is created and should
+        not be called directly by the user.
+
+        The page size and `WITHOUT ROWID` tables only apply to newly created databases.
+        Existing databases keep their layout; their page size can be changed by running
+        `VACUUM` after `PRAGMA journal_mode=DELETE; PRAGMA page_size=32768;`.
         """
         if self.is_setup:
             return
 
         self.conn.executescript(
             """
+            PRAGMA page_size=32768;
             PRAGMA journal_mode=WAL;
             CREATE TABLE IF NOT EXISTS checkpoints (
                 thread_id TEXT NOT NULL,
@@ -134,7 +294,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint BLOB,
                 metadata BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
-            );
+            ) WITHOUT ROWID;
             CREATE TABLE IF NOT EXISTS writes (
                 thread_id TEXT NOT NULL,
                 checkpoint_ns TEXT NOT NULL DEFAULT '',
@@ -145,7 +305,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 type TEXT,
                 value BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
-            );
+            ) WITHOUT ROWID;
             """
         )
 
@@ -165,7 +325,6 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             sqlite3.Cursor: A cursor for the SQLite database.
         """
         with self.lock:
-            self.setup()
             cur = self.conn.cursor()
             try:
                 yield cur
@@ -174,6 +333,90 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     self.conn.commit()
                 cur.close()
 
+    def flush(self) -> None:
+        """Copy the in-memory database to disk.
+
+        This is only needed for savers created with `in_memory(flush_path)`, which flush
+        automatically. For other savers it does nothing.
+        """
+        if self._flush_conn is None:
+            return
+        with self.lock:
+            self.conn.backup(self._flush_conn)
+            self._puts_since_flush = 0
+
+    def _write(self, query: str, params: Sequence[Tuple[Any, ...]]) -> None:
+        """Run `executemany(query, params)` and commit it.
+
+        Concurrent writes are committed together: each caller queues its write and
+        takes the lock, and whoever holds the lock commits every queued write in a
+        single transaction, so callers that find their write already committed don't
+        pay for a commit of their own.
+        """
+        fut: Future = Future()
+        self._pending_writes.put((query, params, fut))
+        with self.lock:
+            if not fut.done():
+                self._commit_pending_writes()
+        fut.result()
+
+    def _commit_pending_writes(self) -> None:
+        batch = []
+        while True:
+            try:
+                batch.append(self._pending_writes.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            try:
+                with closing(self.conn.cursor()) as cur:
+                    for query, params, _ in batch:
+                        cur.executemany(query, params)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                # retry each write in its own transaction, so that only the
+                # failing ones raise
+                for query, params, fut in batch:
+                    try:
+                        with closing(self.conn.cursor()) as cur:
+                            cur.executemany(query, params)
+                        self.conn.commit()
+                    except Exception as exc:
+                        self.conn.rollback()
+                        fut.set_exception(exc)
+                    else:
+                        fut.set_result(None)
+            else:
+                for _, _, fut in batch:
+                    fut.set_result(None)
+        except BaseException as err:
+            # whatever went wrong, no caller may be left waiting on its write
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(err)
+            raise
+
+    def _count_puts(self, n: int) -> None:
+        if self._flush_conn is None:
+            return
+        self._puts_since_flush += n
+        if self._puts_since_flush >= self._flush_every:
+            self.flush()
+
+    @contextmanager
+    def _read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        if self.readers is None:
+            with self.cursor(transaction=False) as cur:
+                yield cur
+            return
+        conn = self.readers.get()
+        try:
+            with closing(conn.cursor()) as cur:
+                yield cur
+        finally:
+            self.readers.put(conn)
+
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database.
 
@@ -209,23 +452,18 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             >>> print(checkpoint_tuple)
             CheckpointTuple(...)
         """  # noqa
-        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
-        with self.cursor(transaction=False) as cur:
+        configurable = config["configurable"]
+        # thread_id is coerced once here, as callers may pass non-str ids
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        with self._read_cursor() as cur:
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        checkpoint_ns,
-                        checkpoint_id,
-                    ),
+                    SELECT_CHECKPOINT_SQL, (thread_id, checkpoint_ns, checkpoint_id)
                 )
             else:
-                cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
-                    (str(config["configurable"]["thread_id"]), checkpoint_ns),
-                )
+                cur.execute(SELECT_LATEST_CHECKPOINT_SQL, (thread_id, checkpoint_ns))
             # if a checkpoint is found, return it
             if value := cur.fetchone():
                 (
@@ -246,12 +484,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     }
                 # find any pending writes
                 cur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        checkpoint_ns,
-                        str(config["configurable"]["checkpoint_id"]),
-                    ),
+                    SELECT_WRITES_SQL, (thread_id, checkpoint_ns, checkpoint_id)
                 )
                 # deserialize the checkpoint and metadata
                 return CheckpointTuple(
@@ -321,47 +554,126 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         ORDER BY checkpoint_id DESC"""
         if limit:
             query += f" LIMIT {limit}"
-        with self.cursor(transaction=False) as cur, closing(self.conn.cursor()) as wcur:
-            cur.execute(query, param_values)
-            for (
-                thread_id,
-                checkpoint_ns,
-                checkpoint_id,
-                parent_checkpoint_id,
-                type,
-                checkpoint,
-                metadata,
-            ) in cur:
-                wcur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
-                    (thread_id, checkpoint_ns, checkpoint_id),
-                )
-                yield CheckpointTuple(
-                    {
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": checkpoint_id,
-                        }
-                    },
-                    self.serde.loads_typed((type, checkpoint)),
-                    self.jsonplus_serde.loads(metadata) if metadata is not None else {},
-                    (
-                        {
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": parent_checkpoint_id,
-                            }
-                        }
-                        if parent_checkpoint_id
-                        else None
-                    ),
-                    [
-                        (task_id, channel, self.serde.loads_typed((type, value)))
-                        for task_id, channel, type, value in wcur
-                    ],
-                )
+        if self.readers is None:
+            # reads share the write connection, so the rows are read up front
+            # rather than holding the lock while the caller iterates
+            with self.cursor(transaction=False) as cur:
+                rows = list(self._fetch_list_rows(cur, query, param_values))
+            yield from map(self._load_checkpoint_tuple, rows)
+            return
+        # a reader connection isn't used for writes, so it's held until the
+        # caller is done, and the rows are loaded one page at a time
+        conn = self.readers.get()
+        try:
+            with closing(conn.cursor()) as cur:
+                for row in self._fetch_list_rows(cur, query, param_values):
+                    yield self._load_checkpoint_tuple(row)
+        finally:
+            self.readers.put(conn)
+
+    def _fetch_list_rows(
+        self, cur: sqlite3.Cursor, query: str, params: Sequence[Any]
+    ) -> Iterator[Tuple[Any, ...]]:
+        with closing(cur.connection.cursor()) as wcur:
+            cur.execute(query, params)
+            while page := cur.fetchmany(_LIST_PAGE_SIZE):
+                for row in page:
+                    # row: thread_id, checkpoint_ns, checkpoint_id, ...
+                    wcur.execute(SELECT_WRITES_SQL, row[:3])
+                    yield (*row, wcur.fetchall())
+
+    def list_json(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> bytes:
+        """List checkpoint configs and metadata as a JSON array.
+
+        The array is built by SQLite's JSON functions, so nothing is deserialized in
+        Python, except for metadata holding NaN or Infinity, which SQLite doesn't accept
+        as JSON. Those values are written as `NaN` and `Infinity`, as Python's `json`
+        module does. Use this instead of `list()` when the result is only going to be
+        serialized again, e.g. when returned from an API endpoint. Checkpoints
+        themselves are stored in the serializer's binary format and are not included.
+
+        Args:
+            config (RunnableConfig): The config to use for listing the checkpoints.
+            filter (Optional[Dict[str, Any]]): Additional filtering criteria for metadata. Defaults to None.
+            before (Optional[RunnableConfig]): If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
+            limit (Optional[int]): The maximum number of checkpoints to return. Defaults to None.
+
+        Returns:
+            bytes: A UTF-8 encoded JSON array of objects with `thread_id`, `checkpoint_ns`,
+                `checkpoint_id`, `parent_checkpoint_id` and `metadata` keys, newest first.
+
+        Examples:
+            >>> from langgraph.checkpoint.sqlite import SqliteSaver
+            >>> with SqliteSaver.from_conn_string(":memory:") as memory:
+            ... # Run a graph, then list the checkpoints
+            >>>     config = {"configurable": {"thread_id": "1"}}
+            >>>     print(memory.list_json(config, limit=1))
+            b'[{"thread_id":"1","checkpoint_ns":"","checkpoint_id":"1ef4f797-8335-6428-8001-8a1503f9b875","parent_checkpoint_id":null,"metadata":{"source":"input","step":-1,"writes":null}}]'
+        """
+        where, param_values = search_where(config, filter, before)
+        # metadata holding NaN or Infinity isn't valid JSON to SQLite, so those
+        # rows are built in Python instead
+        query = f"""SELECT CASE WHEN json_valid(CAST(metadata AS TEXT)) THEN CAST(json_object(
+            'thread_id', thread_id,
+            'checkpoint_ns', checkpoint_ns,
+            'checkpoint_id', checkpoint_id,
+            'parent_checkpoint_id', parent_checkpoint_id,
+            'metadata', json(CAST(metadata AS TEXT))
+        ) AS BLOB) END, thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, metadata
+        FROM checkpoints
+        {where}
+        ORDER BY checkpoint_id DESC
+        LIMIT ?"""
+        with self._read_cursor() as cur:
+            cur.execute(query, (*param_values, limit or -1))
+            rows = cur.fetchall()
+        return b"[" + b",".join(_checkpoint_json(*row) for row in rows) + b"]"
+
+    def _load_checkpoint_tuple(self, row: Tuple[Any, ...]) -> CheckpointTuple:
+        (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            parent_checkpoint_id,
+            type,
+            checkpoint,
+            metadata,
+            writes,
+        ) = row
+        loads_typed = self.serde.loads_typed
+        return CheckpointTuple(
+            {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            loads_typed((type, checkpoint)),
+            self.jsonplus_serde.loads(metadata) if metadata is not None else {},
+            (
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            [
+                (task_id, channel, loads_typed((type, value)))
+                for task_id, channel, type, value in writes
+            ],
+        )
 
     def put(
         self,
@@ -398,19 +710,21 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
         type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        with self.cursor() as cur:
-            cur.execute(
-                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        self._write(
+            UPSERT_CHECKPOINT_SQL,
+            [
                 (
-                    str(config["configurable"]["thread_id"]),
+                    str(thread_id),
                     checkpoint_ns,
                     checkpoint["id"],
                     config["configurable"].get("checkpoint_id"),
                     type_,
                     serialized_checkpoint,
                     serialized_metadata,
-                ),
-            )
+                )
+            ],
+        )
+        self._count_puts(1)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -419,6 +733,52 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             }
         }
 
+    def put_many(
+        self,
+        items: Sequence[
+            Tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]
+        ],
+    ) -> List[RunnableConfig]:
+        """Save multiple checkpoints to the database in a single transaction.
+
+        This is equivalent to calling `put()` once per item, but all checkpoints are
+        inserted with a single `executemany` call and committed once.
+
+        Args:
+            items (Sequence[Tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]]): The (config, checkpoint, metadata, new_versions) arguments of each `put()` call.
+
+        Returns:
+            List[RunnableConfig]: Updated configurations, one per stored checkpoint.
+        """
+        rows = []
+        next_configs: List[RunnableConfig] = []
+        # serialize outside of the lock to keep the critical section short
+        for config, checkpoint, metadata, _ in items:
+            thread_id = config["configurable"]["thread_id"]
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            rows.append(
+                (
+                    str(thread_id),
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    *self.serde.dumps_typed(checkpoint),
+                    self.jsonplus_serde.dumps(metadata),
+                )
+            )
+            next_configs.append(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint["id"],
+                    }
+                }
+            )
+        self._write(UPSERT_CHECKPOINT_SQL, rows)
+        self._count_puts(len(rows))
+        return next_configs
+
     def put_writes(
         self,
         config: RunnableConfig,
@@ -435,26 +795,31 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             task_id (str): Identifier for the task creating the writes.
         """
         query = (
-            "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            UPSERT_WRITES_SQL
             if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            else INSERT_WRITES_SQL
+        )
+        # coerce the key once rather than once per write
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = str(configurable["checkpoint_ns"])
+        checkpoint_id = str(configurable["checkpoint_id"])
+        dumps_typed = self.serde.dumps_typed
+        self._write(
+            query,
+            [
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    task_id,
+                    WRITES_IDX_MAP.get(channel, idx),
+                    channel,
+                    *dumps_typed(value),
+                )
+                for idx, (channel, value) in enumerate(writes)
+            ],
         )
-        with self.cursor() as cur:
-            cur.executemany(
-                query,
-                [
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        str(config["configurable"]["checkpoint_ns"]),
-                        str(config["configurable"]["checkpoint_id"]),
-                        task_id,
-                        WRITES_IDX_MAP.get(channel, idx),
-                        channel,
-                        *self.serde.dumps_typed(value),
-                    )
-                    for idx, (channel, value) in enumerate(writes)
-                ],
-            )
 
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
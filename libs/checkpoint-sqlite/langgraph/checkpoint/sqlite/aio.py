@@ -28,7 +28,15 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INSERT_WRITES_SQL,
+    SELECT_CHECKPOINT_SQL,
+    SELECT_LATEST_CHECKPOINT_SQL,
+    SELECT_WRITES_SQL,
+    UPSERT_CHECKPOINT_SQL,
+    UPSERT_WRITES_SQL,
+    search_where,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -247,6 +255,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 await self.conn
             async with self.conn.executescript(
                 """
+                PRAGMA page_size=32768;
                 PRAGMA journal_mode=WAL;
                 CREATE TABLE IF NOT EXISTS checkpoints (
                     thread_id TEXT NOT NULL,
@@ -257,7 +266,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     checkpoint BLOB,
                     metadata BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
-                );
+                ) WITHOUT ROWID;
                 CREATE TABLE IF NOT EXISTS writes (
                     thread_id TEXT NOT NULL,
                     checkpoint_ns TEXT NOT NULL DEFAULT '',
@@ -268,7 +277,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     type TEXT,
                     value BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
-                );
+                ) WITHOUT ROWID;
                 """
             ):
                 await self.conn.commit()
@@ -290,22 +299,20 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             Optional[CheckpointTuple]: The retrieved checkpoint tuple, or None if no matching checkpoint was found.
         """
         await self.setup()
-        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
         async with self.lock, self.conn.cursor() as cur:
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 await cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        checkpoint_ns,
-                        checkpoint_id,
-                    ),
+                    SELECT_CHECKPOINT_SQL,
+                    (thread_id, checkpoint_ns, checkpoint_id),
                 )
             else:
                 await cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
-                    (str(config["configurable"]["thread_id"]), checkpoint_ns),
+                    SELECT_LATEST_CHECKPOINT_SQL,
+                    (thread_id, checkpoint_ns),
                 )
             # if a checkpoint is found, return it
             if value := await cur.fetchone():
@@ -327,12 +334,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     }
                 # find any pending writes
                 await cur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        checkpoint_ns,
-                        str(config["configurable"]["checkpoint_id"]),
-                    ),
+                    SELECT_WRITES_SQL,
+                    (thread_id, checkpoint_ns, checkpoint_id),
                 )
                 # deserialize the checkpoint and metadata
                 return CheckpointTuple(
@@ -386,6 +389,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         ORDER BY checkpoint_id DESC"""
         if limit:
             query += f" LIMIT {limit}"
+        loads_typed = self.serde.loads_typed
+        loads = self.jsonplus_serde.loads
         async with self.lock, self.conn.execute(
             query, params
         ) as cur, self.conn.cursor() as wcur:
@@ -399,7 +404,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 metadata,
             ) in cur:
                 await wcur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+                    SELECT_WRITES_SQL,
                     (thread_id, checkpoint_ns, checkpoint_id),
                 )
                 yield CheckpointTuple(
@@ -410,8 +415,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
-                    self.jsonplus_serde.loads(metadata) if metadata is not None else {},
+                    loads_typed((type, checkpoint)),
+                    loads(metadata) if metadata is not None else {},
                     (
                         {
                             "configurable": {
@@ -424,7 +429,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         else None
                     ),
                     [
-                        (task_id, channel, self.serde.loads_typed((type, value)))
+                        (task_id, channel, loads_typed((type, value)))
                         async for task_id, channel, type, value in wcur
                     ],
                 )
@@ -456,9 +461,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
         async with self.lock, self.conn.execute(
-            "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            UPSERT_CHECKPOINT_SQL,
             (
-                str(config["configurable"]["thread_id"]),
+                str(thread_id),
                 checkpoint_ns,
                 checkpoint["id"],
                 config["configurable"].get("checkpoint_id"),
@@ -492,23 +497,29 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             task_id (str): Identifier for the task creating the writes.
         """
         query = (
-            "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            UPSERT_WRITES_SQL
             if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            else INSERT_WRITES_SQL
         )
+        # coerce the key once rather than once per write
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = str(configurable["checkpoint_ns"])
+        checkpoint_id = str(configurable["checkpoint_id"])
+        dumps_typed = self.serde.dumps_typed
         await self.setup()
         async with self.lock, self.conn.cursor() as cur:
             await cur.executemany(
                 query,
                 [
                     (
-                        str(config["configurable"]["thread_id"]),
-                        str(config["configurable"]["checkpoint_ns"]),
-                        str(config["configurable"]["checkpoint_id"]),
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
                         task_id,
                         WRITES_IDX_MAP.get(channel, idx),
                         channel,
-                        *self.serde.dumps_typed(value),
+                        *dumps_typed(value),
                     )
                     for idx, (channel, value) in enumerate(writes)
                 ],
@@ -5,6 +5,21 @@ from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import get_checkpoint_id
 
+# Statements are kept verbatim as module constants so that sqlite3's per-connection
+# statement cache can reuse their compiled form across calls.
+
+SELECT_CHECKPOINT_SQL = "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?"
+
+SELECT_LATEST_CHECKPOINT_SQL = "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1"
+
+SELECT_WRITES_SQL = "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx"
+
+UPSERT_CHECKPOINT_SQL = "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+UPSERT_WRITES_SQL = "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+INSERT_WRITES_SQL = "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
 
 def _metadata_predicate(
     metadata_filter: Dict[str, Any],
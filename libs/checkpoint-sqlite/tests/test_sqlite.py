@@ -1,11 +1,19 @@
-from typing import Any, cast
+import json
+import math
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterator, Optional, cast
 
 import pytest
 from langchain_core.runnables import RunnableConfig
 
+import langgraph.checkpoint.sqlite as sqlite_module
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    CheckpointTuple,
     create_checkpoint,
     empty_checkpoint,
 )
@@ -145,6 +153,243 @@ class TestSqliteSaver:
             expected_param_values_3,
         )
 
+    def test_put_non_finite_metadata(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            metadata = {**self.metadata_1, "score": math.inf}
+            config = saver.put(self.config_1, self.chkpnt_1, metadata, {})
+            tup = saver.get_tuple(config)
+            assert tup is not None
+            assert tup.metadata["score"] == math.inf
+
+    def test_concurrent_put_writes(self, tmp_path: Path) -> None:
+        with SqliteSaver.from_conn_string(
+            str(tmp_path / "db.sqlite")
+        ) as saver, ThreadPoolExecutor(8) as executor:
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            list(
+                executor.map(
+                    lambda i: saver.put_writes(config, [("channel", i)], f"task-{i}"),
+                    range(32),
+                )
+            )
+            tup = saver.get_tuple(config)
+            assert tup is not None
+            assert sorted(v for _, _, v in tup.pending_writes or []) == list(range(32))
+
+    def test_failed_batch_resolves_every_write(self) -> None:
+        class Interrupted(BaseException):
+            pass
+
+        def params() -> Iterator[tuple[Any, ...]]:
+            raise Interrupted
+            yield ()
+
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            # queued by another thread that is waiting on the lock
+            queued: Future = Future()
+            saver._pending_writes.put(
+                ("INSERT INTO writes (thread_id) VALUES (?)", params(), queued)
+            )
+            with pytest.raises(Interrupted):
+                saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert isinstance(queued.exception(timeout=0), Interrupted)
+
+    def test_list_pages(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setattr(sqlite_module, "_LIST_PAGE_SIZE", 2)
+        for conn_string in (":memory:", str(tmp_path / "db.sqlite")):
+            with SqliteSaver.from_conn_string(conn_string, readers=1) as saver:
+                # checkpoints interleaved across two threads
+                for i in range(6):
+                    saver.put(
+                        {
+                            "configurable": {
+                                "thread_id": f"thread-{i % 2}",
+                                "checkpoint_ns": "",
+                            }
+                        },
+                        {**self.chkpnt_1, "id": str(i)},
+                        self.metadata_1,
+                        {},
+                    )
+
+                def ids(limit: Optional[int] = None) -> list[str]:
+                    return [
+                        c.config["configurable"]["checkpoint_id"]
+                        for c in saver.list(None, limit=limit)
+                    ]
+
+                assert ids() == ["5", "4", "3", "2", "1", "0"]
+                assert ids(limit=3) == ["5", "4", "3"]
+
+                # checkpoints saved after listing starts are not returned
+                it = saver.list(None)
+                first = next(it)
+                if saver.readers is not None:
+                    # the reader is held while the caller iterates
+                    assert saver.readers.empty()
+                saver.put(
+                    {"configurable": {"thread_id": "thread-2", "checkpoint_ns": ""}},
+                    {**self.chkpnt_1, "id": "6"},
+                    self.metadata_1,
+                    {},
+                )
+                rest = list(it)
+                assert [first, *rest] == list(saver.list(None))[1:]
+                if saver.readers is not None:
+                    assert saver.readers.qsize() == 1
+
+    def test_put_many(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            configs = saver.put_many(
+                [
+                    (self.config_1, self.chkpnt_1, self.metadata_1, {}),
+                    (self.config_2, self.chkpnt_2, self.metadata_2, {}),
+                    (self.config_3, self.chkpnt_3, self.metadata_3, {}),
+                ]
+            )
+            assert [c["configurable"]["checkpoint_id"] for c in configs] == [
+                self.chkpnt_1["id"],
+                self.chkpnt_2["id"],
+                self.chkpnt_3["id"],
+            ]
+            assert len(list(saver.list(None))) == 3
+
+            saved = saver.get_tuple(configs[1])
+            assert saved is not None
+            assert saved.checkpoint == self.chkpnt_2
+            assert saved.metadata == self.metadata_2
+            assert saved.parent_config == {
+                "configurable": {
+                    "thread_id": "thread-2",
+                    "checkpoint_ns": "",
+                    "checkpoint_id": "2",
+                }
+            }
+
+    def test_list_json(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            assert json.loads(saver.list_json(None)) == []
+
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+
+            def as_dicts(tuples: list[CheckpointTuple]) -> list[dict[str, Any]]:
+                return [
+                    {
+                        **t.config["configurable"],
+                        "parent_checkpoint_id": (
+                            t.parent_config["configurable"]["checkpoint_id"]
+                            if t.parent_config
+                            else None
+                        ),
+                        "metadata": t.metadata,
+                    }
+                    for t in tuples
+                ]
+
+            result = saver.list_json(None)
+            assert isinstance(result, bytes)
+            assert json.loads(result) == as_dicts(list(saver.list(None)))
+            assert json.loads(
+                saver.list_json(
+                    {"configurable": {"thread_id": "thread-2"}},
+                    filter={"source": "loop"},
+                )
+            ) == as_dicts(list(saver.list(None, filter={"source": "loop"})))
+            assert json.loads(saver.list_json(None, limit=2)) == as_dicts(
+                list(saver.list(None, limit=2))
+            )
+
+            # metadata SQLite can't parse as JSON
+            saver.put(
+                self.config_1,
+                {**self.chkpnt_1, "id": "9"},
+                {**self.metadata_1, "score": math.inf},
+                {},
+            )
+            saver.put(
+                self.config_1,
+                {**self.chkpnt_1, "id": "10"},
+                {**self.metadata_1, "score": math.nan},
+                {},
+            )
+            result = json.loads(saver.list_json(None))
+            assert math.isnan(result[-1]["metadata"].pop("score"))
+            expected = as_dicts(list(saver.list(None)))
+            del expected[-1]["metadata"]["score"]
+            assert result == expected
+
+    def test_from_conn_string_pragmas(self, tmp_path: Path) -> None:
+        with SqliteSaver.from_conn_string(str(tmp_path / "db.sqlite")) as saver:
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert saver.conn.isolation_level == "IMMEDIATE"
+            assert saver.conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            # NORMAL
+            assert saver.conn.execute("PRAGMA synchronous").fetchone() == (1,)
+            # MEMORY
+            assert saver.conn.execute("PRAGMA temp_store").fetchone() == (2,)
+            assert saver.conn.execute("PRAGMA journal_size_limit").fetchone() == (
+                33554432,
+            )
+            assert saver.conn.execute("PRAGMA page_size").fetchone() == (32768,)
+
+        # in-memory databases are left untuned
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            # FULL
+            assert saver.conn.execute("PRAGMA synchronous").fetchone() == (2,)
+
+    def test_caller_connection_pragmas(self, tmp_path: Path) -> None:
+        conn = sqlite3.connect(str(tmp_path / "db.sqlite"), timeout=30)
+        with closing(conn):
+            saver = SqliteSaver(conn)
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert conn.execute("PRAGMA busy_timeout").fetchone() == (30000,)
+            # FULL
+            assert conn.execute("PRAGMA synchronous").fetchone() == (2,)
+
+    def test_from_conn_string_readers(self, tmp_path: Path) -> None:
+        with SqliteSaver.from_conn_string(
+            str(tmp_path / "db.sqlite"), readers=2
+        ) as saver:
+            assert saver.readers is not None
+            assert saver.readers.qsize() == 2
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            # reads go through the reader connections and see committed writes
+            with saver.lock:
+                tup = saver.get_tuple(config)
+                assert tup is not None
+                assert tup.metadata == self.metadata_1
+                assert len(list(saver.list(None))) == 1
+            assert saver.readers.qsize() == 2
+            reader = saver.readers.get()
+            assert reader.execute("PRAGMA query_only").fetchone() == (1,)
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM checkpoints")
+
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            assert saver.readers is None
+
+    def test_in_memory_flush(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "db.sqlite")
+
+        def count_on_disk() -> int:
+            with closing(sqlite3.connect(path)) as conn:
+                return conn.execute("SELECT count(*) FROM checkpoints").fetchone()[0]
+
+        with SqliteSaver.in_memory(path, flush_every=2) as saver:
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert count_on_disk() == 0
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            assert count_on_disk() == 2
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+        # flushed on exit
+        assert count_on_disk() == 3
+
+        # existing checkpoints are loaded on entry
+        with SqliteSaver.in_memory(path) as saver:
+            assert len(list(saver.list(None))) == 3
+
     async def test_informative_async_errors(self) -> None:
         with SqliteSaver.from_conn_string(":memory:") as saver:
             # call method / assertions
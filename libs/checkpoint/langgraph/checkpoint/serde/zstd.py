@@ -0,0 +1,98 @@
+import threading
+from typing import Any, Optional
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ZSTD_SUFFIX = "+zstd"
+
+
+class MsgpackZstdSerializer(SerializerProtocol):
+    """Serializer that compresses typed payloads with zstandard.
+
+    Values are first serialized with the wrapped serializer (by default
+    `JsonPlusSerializer`, which produces msgpack), and the result is compressed
+    with zstd. Compressed payloads are tagged by appending `+zstd` to the type
+    returned by the wrapped serializer, eg. `msgpack+zstd`, so values written
+    before compression was enabled can still be loaded.
+
+    `dumps` and `loads` are not compressed, as savers use them for metadata which
+    may need to stay queryable in the database.
+
+    Tip:
+        Requires the [zstandard](https://pypi.org/project/zstandard/) package.
+        Install it with `pip install "langgraph-checkpoint[zstd]"`.
+
+    Args:
+        serde (Optional[SerializerProtocol]): The serializer to wrap. Defaults to JsonPlusSerializer.
+        level (int): The zstd compression level. Defaults to 3.
+        min_size (int): Payloads smaller than this number of bytes are stored uncompressed. Defaults to 64.
+
+    Examples:
+
+        >>> import sqlite3
+        >>> from langgraph.checkpoint.serde.zstd import MsgpackZstdSerializer
+        >>> from langgraph.checkpoint.sqlite import SqliteSaver
+        >>>
+        >>> conn = sqlite3.connect("checkpoints.sqlite", check_same_thread=False)
+        >>> memory = SqliteSaver(conn, serde=MsgpackZstdSerializer())
+    """
+
+    def __init__(
+        self,
+        serde: Optional[SerializerProtocol] = None,
+        *,
+        level: int = 3,
+        min_size: int = 64,
+    ) -> None:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "MsgpackZstdSerializer requires the zstandard package.\n"
+                "Install with:\n`pip install \"langgraph-checkpoint[zstd]\"`"
+            ) from None
+        self._zstd = zstandard
+        self.serde = serde or JsonPlusSerializer()
+        self.level = level
+        self.min_size = min_size
+        # zstd (de)compressors are not thread-safe, so each thread reuses its own
+        self._local = threading.local()
+
+    def _compressor(self) -> Any:
+        try:
+            return self._local.compressor
+        except AttributeError:
+            self._local.compressor = self._zstd.ZstdCompressor(level=self.level)
+            return self._local.compressor
+
+    def _decompressor(self) -> Any:
+        try:
+            return self._local.decompressor
+        except AttributeError:
+            self._local.decompressor = self._zstd.ZstdDecompressor()
+            return self._local.decompressor
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        if len(data) < self.min_size:
+            return type_, data
+        compressed = self._compressor().compress(data)
+        return type_ + ZSTD_SUFFIX, compressed
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, data_ = data
+        if type_.endswith(ZSTD_SUFFIX):
+            return self.serde.loads_typed(
+                (
+                    type_[: -len(ZSTD_SUFFIX)],
+                    self._decompressor().decompress(data_),
+                )
+            )
+        return self.serde.loads_typed(data)
@@ -0,0 +1,36 @@
+import pytest
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+zstandard = pytest.importorskip("zstandard")
+
+from langgraph.checkpoint.serde.zstd import MsgpackZstdSerializer  # noqa: E402
+
+
+def test_serde_zstd_roundtrip() -> None:
+    serde = MsgpackZstdSerializer()
+    obj = {"messages": ["hello world"] * 100, "count": 1, "nested": {"a": [1, 2]}}
+
+    type_, data = serde.dumps_typed(obj)
+    assert type_ == "msgpack+zstd"
+    assert len(data) < len(JsonPlusSerializer().dumps_typed(obj)[1])
+    assert serde.loads_typed((type_, data)) == obj
+
+
+def test_serde_zstd_small_values_uncompressed() -> None:
+    serde = MsgpackZstdSerializer()
+
+    assert serde.dumps_typed({"a": 1})[0] == "msgpack"
+    assert serde.dumps_typed(b"raw") == ("bytes", b"raw")
+    assert serde.loads_typed(serde.dumps_typed({"a": 1})) == {"a": 1}
+
+
+def test_serde_zstd_loads_uncompressed() -> None:
+    serde = MsgpackZstdSerializer()
+    obj = {"messages": ["hello world"] * 100}
+
+    # values written without compression can still be read
+    assert serde.loads_typed(JsonPlusSerializer().dumps_typed(obj)) == obj
+    assert serde.loads_typed(("json", JsonPlusSerializer().dumps(obj))) == obj
+    # untyped methods are not compressed
+    assert serde.dumps(obj) == JsonPlusSerializer().dumps(obj)
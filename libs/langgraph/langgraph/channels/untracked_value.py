@@ -5,6 +5,9 @@ from typing_extensions import Self
 from langgraph.channels.base import BaseChannel, Value
 from langgraph.errors import EmptyChannelError, InvalidUpdateError
 
+# marks an empty channel, cheaper to check for than an unset attribute
+MISSING = object()
+
 
 class UntrackedValue(Generic[Value], BaseChannel[Value, Value, Value]):
     """Stores the last value received, never checkpointed."""
@@ -14,10 +17,14 @@ class UntrackedValue(Generic[Value], BaseChannel[Value, Value, Value]):
     def __init__(self, typ: Type[Value], guard: bool = True) -> None:
         super().__init__(typ)
         self.guard = guard
+        self.value: Value = MISSING  # type: ignore[assignment]
 
     def __eq__(self, value: object) -> bool:
         return isinstance(value, UntrackedValue) and value.guard == self.guard
 
+    def __hash__(self) -> int:
+        return hash((UntrackedValue, self.guard))
+
     @property
     def ValueType(self) -> Type[Value]:
         """The type of the value stored in the channel."""
@@ -37,9 +44,9 @@ class UntrackedValue(Generic[Value], BaseChannel[Value, Value, Value]):
         return empty
 
     def update(self, values: Sequence[Value]) -> bool:
-        if len(values) == 0:
+        if not values:
             return False
-        if len(values) != 1 and self.guard:
+        if self.guard and len(values) != 1:
             raise InvalidUpdateError(
                 f"At key '{self.key}': UntrackedValue(guard=True) can receive only one value per step. Use guard=False if you want to store any one of multiple values."
             )
@@ -48,7 +55,7 @@ class UntrackedValue(Generic[Value], BaseChannel[Value, Value, Value]):
         return True
 
     def get(self) -> Value:
-        try:
-            return self.value
-        except AttributeError:
+        value = self.value
+        if value is MISSING:
             raise EmptyChannelError()
+        return value
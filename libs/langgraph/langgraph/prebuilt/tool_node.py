@@ -3,14 +3,19 @@ from __future__ import annotations
 import asyncio
 import inspect
 import json
-from copy import copy
+import threading
+import time
+from collections import OrderedDict
+from copy import copy, deepcopy
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Literal,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -37,6 +42,7 @@ from langchain_core.tools import tool as create_tool
 from typing_extensions import Annotated, get_args, get_origin
 
 from langgraph.errors import GraphInterrupt
+from langgraph.pregel.executor import gated
 from langgraph.store.base import BaseStore
 from langgraph.utils.runnable import RunnableCallable
 
@@ -47,6 +53,7 @@ INVALID_TOOL_NAME_ERROR_TEMPLATE = (
     "Error: {requested_tool} is not a valid tool, try one of [{available_tools}]."
 )
 TOOL_CALL_ERROR_TEMPLATE = "Error: {error}\n Please fix your mistakes."
+TOOL_RESULT_CACHE_SIZE = 1024
 
 
 def msg_content_output(output: Any) -> str | List[dict]:
@@ -54,10 +61,8 @@ def msg_content_output(output: Any) -> str | List[dict]:
     if isinstance(output, str):
         return output
     elif all(
-        [
-            isinstance(x, dict) and x.get("type") in recognized_content_block_types
-            for x in output
-        ]
+        isinstance(x, dict) and x.get("type") in recognized_content_block_types
+        for x in output
     ):
         return output
     # Technically a list of strings is also valid message content but it's not currently
@@ -159,6 +164,18 @@ class ToolNode(RunnableCallable):
         messages_key: The state key in the input that contains the list of messages.
             The same key will be used for the output from the ToolNode.
             Defaults to "messages".
+        cacheable_tools: Optional mapping of tool name to a time-to-live in seconds.
+            Successful results of these tools are cached by their arguments, and a
+            repeated call with the same arguments within the TTL returns the cached
+            result instead of invoking the tool again. Only use this for tools without
+            side effects. The cache belongs to the ToolNode instance and is shared by
+            every thread and user that runs it, so only cache tools whose result
+            depends on nothing but their arguments. Tools with injected state or store,
+            or that accept a RunnableConfig, can't be cached. Defaults to None.
+        inline_tools: Optional names of tools that are cheap, synchronous computations.
+            When running synchronously, calls to these tools are run on the calling
+            thread instead of being handed to the thread pool, while calls to other
+            tools still run in parallel. Defaults to None.
 
     The `ToolNode` is roughly analogous to:
 
@@ -191,6 +208,8 @@ class ToolNode(RunnableCallable):
             bool, str, Callable[..., str], tuple[type[Exception], ...]
         ] = True,
         messages_key: str = "messages",
+        cacheable_tools: Optional[Mapping[str, float]] = None,
+        inline_tools: Optional[Sequence[str]] = None,
     ) -> None:
         super().__init__(self._func, self._afunc, name=name, tags=tags, trace=False)
         self.tools_by_name: Dict[str, BaseTool] = {}
@@ -204,6 +223,29 @@ class ToolNode(RunnableCallable):
             self.tools_by_name[tool_.name] = tool_
             self.tool_to_state_args[tool_.name] = _get_state_args(tool_)
             self.tool_to_store_arg[tool_.name] = _get_store_arg(tool_)
+        self._needs_injection = any(self.tool_to_state_args.values()) or any(
+            self.tool_to_store_arg.values()
+        )
+        self.cacheable_tools = dict(cacheable_tools or {})
+        for tool_name in self.cacheable_tools:
+            if tool_name not in self.tools_by_name:
+                raise ValueError(f"Cannot cache unknown tool {tool_name}.")
+            if self.tool_to_state_args[tool_name] or self.tool_to_store_arg[tool_name]:
+                raise ValueError(
+                    f"Cannot cache tool {tool_name}, as it has injected state or store."
+                )
+            if _accepts_config(self.tools_by_name[tool_name]):
+                raise ValueError(
+                    f"Cannot cache tool {tool_name}, as it accepts a RunnableConfig."
+                )
+        self._result_cache: OrderedDict[
+            Tuple[str, Hashable], Tuple[float, ToolMessage]
+        ] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self.inline_tools = frozenset(inline_tools or ())
+        for tool_name in self.inline_tools:
+            if tool_name not in self.tools_by_name:
+                raise ValueError(f"Cannot run unknown tool {tool_name} inline.")
 
     def _func(
         self,
@@ -217,12 +259,52 @@ class ToolNode(RunnableCallable):
         store: BaseStore,
     ) -> Any:
         tool_calls, output_type = self._parse_input(input, store)
-        config_list = get_config_list(config, len(tool_calls))
-        with get_executor_for_config(config) as executor:
-            outputs = [*executor.map(self._run_one, tool_calls, config_list)]
+        unique_calls, slots = self._dedupe_tool_calls(tool_calls)
+        outputs = self._run_many(unique_calls, config)
+        if slots is not None:
+            outputs = _broadcast_outputs(tool_calls, slots, outputs)
         # TypedDict, pydantic, dataclass, etc. should all be able to load from dict
         return outputs if output_type == "list" else {self.messages_key: outputs}
 
+    def _run_many(
+        self, tool_calls: List[ToolCall], config: RunnableConfig
+    ) -> List[ToolMessage]:
+        if len(tool_calls) == 1:
+            # no need for a thread pool to run a single tool call
+            outputs = [self._run_one(tool_calls[0], config)]
+        else:
+            if config.get("run_id") is None:
+                # each tool run gets its own run id, so calls can share the config
+                config_list = [config] * len(tool_calls)
+            else:
+                # only the first call may use the given run id
+                config_list = get_config_list(config, len(tool_calls))
+            if not self.inline_tools:
+                with get_executor_for_config(config) as executor:
+                    outputs = [*executor.map(self._run_one, tool_calls, config_list)]
+            elif all(call["name"] in self.inline_tools for call in tool_calls):
+                outputs = [*map(self._run_one, tool_calls, config_list)]
+            else:
+                with get_executor_for_config(config) as executor:
+                    # start the pooled calls first, so they run alongside inline ones
+                    futures = [
+                        None
+                        if call["name"] in self.inline_tools
+                        else executor.submit(self._run_one, call, call_config)
+                        for call, call_config in zip(tool_calls, config_list)
+                    ]
+                    inline_outputs = [
+                        self._run_one(call, call_config) if fut is None else None
+                        for call, call_config, fut in zip(
+                            tool_calls, config_list, futures
+                        )
+                    ]
+                    outputs = [
+                        fut.result() if fut is not None else cast(ToolMessage, output)
+                        for fut, output in zip(futures, inline_outputs)
+                    ]
+        return outputs
+
     def invoke(
         self, input: Input, config: Optional[RunnableConfig] = None, **kwargs: Any
     ) -> Any:
@@ -249,24 +331,74 @@ class ToolNode(RunnableCallable):
         store: BaseStore,
     ) -> Any:
         tool_calls, output_type = self._parse_input(input, store)
-        outputs = await asyncio.gather(
-            *(self._arun_one(call, config) for call in tool_calls)
-        )
+        unique_calls, slots = self._dedupe_tool_calls(tool_calls)
+        outputs = await self._arun_many(unique_calls, config)
+        if slots is not None:
+            outputs = _broadcast_outputs(tool_calls, slots, outputs)
         # TypedDict, pydantic, dataclass, etc. should all be able to load from dict
         return outputs if output_type == "list" else {self.messages_key: outputs}
 
+    async def _arun_many(
+        self, tool_calls: List[ToolCall], config: RunnableConfig
+    ) -> List[ToolMessage]:
+        if len(tool_calls) == 1:
+            outputs = [await self._arun_one(tool_calls[0], config)]
+        elif max_concurrency := config.get("max_concurrency"):
+            # bound concurrent tool calls, as the sync thread pool does
+            semaphore = asyncio.Semaphore(max_concurrency)
+            outputs = await asyncio.gather(
+                *(gated(semaphore, self._arun_one(call, config)) for call in tool_calls)
+            )
+        else:
+            outputs = await asyncio.gather(
+                *(self._arun_one(call, config) for call in tool_calls)
+            )
+        return outputs
+
+    def _dedupe_tool_calls(
+        self, tool_calls: List[ToolCall]
+    ) -> Tuple[List[ToolCall], Optional[List[int]]]:
+        """Drop repeated calls to cacheable tools with the same arguments.
+
+        Returns the calls to run and, if any were dropped, the index into them of the
+        call whose result answers each of the original tool calls.
+        """
+        if not self.cacheable_tools or len(tool_calls) < 2:
+            return tool_calls, None
+        unique_calls: List[ToolCall] = []
+        slots: List[int] = []
+        seen: Dict[Tuple[str, Hashable], int] = {}
+        for call in tool_calls:
+            if (key := self._result_cache_key(call)) is None:
+                slots.append(len(unique_calls))
+                unique_calls.append(call)
+            elif (slot := seen.get(key)) is not None:
+                slots.append(slot)
+            else:
+                seen[key] = len(unique_calls)
+                slots.append(len(unique_calls))
+                unique_calls.append(call)
+        if len(unique_calls) == len(tool_calls):
+            return tool_calls, None
+        return unique_calls, slots
+
     def _run_one(self, call: ToolCall, config: RunnableConfig) -> ToolMessage:
         if invalid_tool_message := self._validate_tool_call(call):
             return invalid_tool_message
+        if cache_key := self._result_cache_key(call):
+            if cached_message := self._get_cached_result(cache_key, call):
+                return cached_message
 
         try:
-            input = {**call, **{"type": "tool_call"}}
+            input = {**call, "type": "tool_call"}
             tool_message: ToolMessage = self.tools_by_name[call["name"]].invoke(
                 input, config
             )
             tool_message.content = cast(
                 Union[str, list], msg_content_output(tool_message.content)
             )
+            if cache_key:
+                self._cache_result(cache_key, tool_message)
             return tool_message
         # GraphInterrupt is a special exception that will always be raised.
         # It can be triggered in the following scenarios:
@@ -299,15 +431,20 @@ class ToolNode(RunnableCallable):
     async def _arun_one(self, call: ToolCall, config: RunnableConfig) -> ToolMessage:
         if invalid_tool_message := self._validate_tool_call(call):
             return invalid_tool_message
+        if cache_key := self._result_cache_key(call):
+            if cached_message := self._get_cached_result(cache_key, call):
+                return cached_message
 
         try:
-            input = {**call, **{"type": "tool_call"}}
+            input = {**call, "type": "tool_call"}
             tool_message: ToolMessage = await self.tools_by_name[call["name"]].ainvoke(
                 input, config
             )
             tool_message.content = cast(
                 Union[str, list], msg_content_output(tool_message.content)
             )
+            if cache_key:
+                self._cache_result(cache_key, tool_message)
             return tool_message
         # GraphInterrupt is a special exception that will always be raised.
         # It can be triggered in the following scenarios:
@@ -349,7 +486,7 @@ class ToolNode(RunnableCallable):
         if isinstance(input, list):
             output_type = "list"
             message: AnyMessage = input[-1]
-        elif isinstance(input, dict) and (messages := input.get(self.messages_key, [])):
+        elif isinstance(input, dict) and (messages := input.get(self.messages_key)):
             output_type = "dict"
             message = messages[-1]
         elif messages := getattr(input, self.messages_key, None):
@@ -362,6 +499,8 @@ class ToolNode(RunnableCallable):
         if not isinstance(message, AIMessage):
             raise ValueError("Last message is not an AIMessage")
 
+        if not self._needs_injection:
+            return message.tool_calls, output_type
         tool_calls = [
             self._inject_tool_args(call, input, store) for call in message.tool_calls
         ]
@@ -379,6 +518,47 @@ class ToolNode(RunnableCallable):
         else:
             return None
 
+    def _result_cache_key(self, call: ToolCall) -> Optional[Tuple[str, Hashable]]:
+        if call["name"] not in self.cacheable_tools:
+            return None
+        try:
+            key = (call["name"], _args_key(call["args"]))
+            hash(key)
+        except TypeError:
+            # arguments that can't be hashed aren't cached
+            return None
+        return key
+
+    def _get_cached_result(
+        self, key: Tuple[str, Hashable], call: ToolCall
+    ) -> Optional[ToolMessage]:
+        with self._result_cache_lock:
+            if (entry := self._result_cache.get(key)) is None:
+                return None
+            expires_at, tool_message = entry
+            if expires_at <= time.monotonic():
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+        cached_message = deepcopy(tool_message)
+        cached_message.tool_call_id = cast(str, call["id"])
+        cached_message.id = None
+        return cached_message
+
+    def _cache_result(
+        self, key: Tuple[str, Hashable], tool_message: ToolMessage
+    ) -> None:
+        if tool_message.status == "error":
+            return
+        expires_at = time.monotonic() + self.cacheable_tools[key[0]]
+        with self._result_cache_lock:
+            # store a deep copy, as the returned message (including list content
+            # or its artifact) may be modified downstream
+            self._result_cache[key] = (expires_at, deepcopy(tool_message))
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > TOOL_RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
     def _inject_state(
         self,
         tool_call: ToolCall,
@@ -389,7 +569,9 @@ class ToolNode(RunnableCallable):
         ],
     ) -> ToolCall:
         state_args = self.tool_to_state_args[tool_call["name"]]
-        if state_args and isinstance(input, list):
+        if not state_args:
+            return tool_call
+        if isinstance(input, list):
             required_fields = list(state_args.values())
             if (
                 len(required_fields) == 1
@@ -453,13 +635,49 @@ class ToolNode(RunnableCallable):
     ) -> ToolCall:
         if tool_call["name"] not in self.tools_by_name:
             return tool_call
+        if (
+            not self.tool_to_state_args[tool_call["name"]]
+            and not self.tool_to_store_arg[tool_call["name"]]
+        ):
+            return tool_call
 
-        tool_call_copy: ToolCall = copy(tool_call)
+        tool_call_copy: ToolCall = {**tool_call}
         tool_call_with_state = self._inject_state(tool_call_copy, input)
         tool_call_with_store = self._inject_store(tool_call_with_state, store)
         return tool_call_with_store
 
 
+def _args_key(value: Any) -> Hashable:
+    """Build a hashable key for tool call arguments.
+
+    Values are tagged with their type, so that e.g. `1`, `1.0` and `True`, or a dict
+    and a list of pairs, don't share a key.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _args_key(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_args_key(v) for v in value))
+    return (type(value), value)
+
+
+def _broadcast_outputs(
+    tool_calls: List[ToolCall], slots: List[int], outputs: List[ToolMessage]
+) -> List[ToolMessage]:
+    """Give each tool call the output of the call that ran in its place."""
+    broadcast: List[ToolMessage] = []
+    used: set[int] = set()
+    for call, slot in zip(tool_calls, slots):
+        output = outputs[slot]
+        if slot in used:
+            output = copy(output)
+            output.tool_call_id = cast(str, call["id"])
+            output.id = None
+        else:
+            used.add(slot)
+        broadcast.append(output)
+    return broadcast
+
+
 def tools_condition(
     state: Union[list[AnyMessage], dict[str, Any], BaseModel],
     messages_key: str = "messages",
@@ -515,13 +733,13 @@ def tools_condition(
     """
     if isinstance(state, list):
         ai_message = state[-1]
-    elif isinstance(state, dict) and (messages := state.get(messages_key, [])):
+    elif isinstance(state, dict) and (messages := state.get(messages_key)):
         ai_message = messages[-1]
-    elif messages := getattr(state, messages_key, []):
+    elif messages := getattr(state, messages_key, None):
         ai_message = messages[-1]
     else:
         raise ValueError(f"No messages found in input state to tool_edge: {state}")
-    if hasattr(ai_message, "tool_calls") and len(ai_message.tool_calls) > 0:
+    if getattr(ai_message, "tool_calls", None):
         return "tools"
     return "__end__"
 
@@ -645,13 +863,17 @@ class InjectedStore(InjectedToolArg):
 def _is_injection(
     type_arg: Any, injection_type: Union[Type[InjectedState], Type[InjectedStore]]
 ) -> bool:
-    if isinstance(type_arg, injection_type) or (
-        isinstance(type_arg, type) and issubclass(type_arg, injection_type)
-    ):
-        return True
-    origin_ = get_origin(type_arg)
-    if origin_ is Union or origin_ is Annotated:
-        return any(_is_injection(ta, injection_type) for ta in get_args(type_arg))
+    # walk nested Union / Annotated args without recursing
+    stack = [type_arg]
+    while stack:
+        type_arg = stack.pop()
+        if isinstance(type_arg, injection_type) or (
+            isinstance(type_arg, type) and issubclass(type_arg, injection_type)
+        ):
+            return True
+        origin_ = get_origin(type_arg)
+        if origin_ is Union or origin_ is Annotated:
+            stack.extend(get_args(type_arg))
     return False
 
 
@@ -700,3 +922,19 @@ def _get_store_arg(tool: BaseTool) -> Optional[str]:
             pass
 
     return None
+
+
+def _accepts_config(tool: BaseTool) -> bool:
+    funcs = [getattr(tool, "func", None), getattr(tool, "coroutine", None)]
+    if not any(funcs):
+        funcs = [tool._run, tool._arun]
+    for func in funcs:
+        if func is None:
+            continue
+        try:
+            type_hints = get_type_hints(func)
+        except Exception:
+            continue
+        if any(type_ is RunnableConfig for type_ in type_hints.values()):
+            return True
+    return False
@@ -6,6 +6,7 @@ import pytest
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.last_value import LastValue
 from langgraph.channels.topic import Topic
+from langgraph.channels.untracked_value import UntrackedValue
 from langgraph.errors import EmptyChannelError, InvalidUpdateError
 
 pytestmark = pytest.mark.anyio
@@ -30,6 +31,29 @@ def test_last_value() -> None:
     assert channel.get() == 4
 
 
+def test_untracked_value() -> None:
+    channel = UntrackedValue(int).from_checkpoint(None)
+    with pytest.raises(EmptyChannelError):
+        channel.get()
+    assert channel.update([]) is False
+    with pytest.raises(InvalidUpdateError):
+        channel.update([5, 6])
+
+    assert channel.update([3]) is True
+    assert channel.get() == 3
+    with pytest.raises(EmptyChannelError):
+        channel.checkpoint()
+    # never restored from a checkpoint
+    with pytest.raises(EmptyChannelError):
+        channel.from_checkpoint(3).get()
+
+    unguarded = UntrackedValue(int, guard=False).from_checkpoint(None)
+    assert unguarded.update([5, 6]) is True
+    assert unguarded.get() == 6
+
+    assert len({UntrackedValue(int), UntrackedValue(str), unguarded}) == 2
+
+
 def test_topic() -> None:
     channel = Topic(str).from_checkpoint(None)
     assert channel.ValueType is Sequence[str]
@@ -1,5 +1,7 @@
+import asyncio
 import dataclasses
 import json
+import threading
 from functools import partial
 from typing import (
     Annotated,
@@ -28,7 +30,7 @@ from langchain_core.messages import (
     ToolMessage,
 )
 from langchain_core.outputs import ChatGeneration, ChatResult
-from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 from langchain_core.tools import BaseTool, ToolException
 from langchain_core.tools import tool as dec_tool
 from pydantic import BaseModel, ValidationError
@@ -50,6 +52,7 @@ from langgraph.prebuilt.tool_node import (
     TOOL_CALL_ERROR_TEMPLATE,
     InjectedState,
     InjectedStore,
+    _args_key,
     _infer_handled_types,
 )
 from langgraph.store.base import BaseStore
@@ -1196,6 +1199,216 @@ def test_tool_node_ensure_utf8() -> None:
     assert outputs[0].content == json.dumps(data, ensure_ascii=False)
 
 
+async def test_tool_node_cacheable_tools() -> None:
+    calls: list[int] = []
+
+    @dec_tool
+    def lookup(a: int) -> str:
+        """Look up a."""
+        calls.append(a)
+        return f"result {a}"
+
+    @dec_tool
+    def flaky(a: int) -> str:
+        """Fail on a."""
+        calls.append(a)
+        raise ValueError("oops")
+
+    @dec_tool
+    def blocks(a: int) -> list:
+        """Return a as content blocks."""
+        calls.append(a)
+        return [{"type": "text", "text": f"result {a}"}]
+
+    @dec_tool
+    def with_state(a: int, state: Annotated[dict, InjectedState]) -> str:
+        """Use state."""
+        return "ok"
+
+    @dec_tool
+    def with_config(a: int, config: RunnableConfig) -> str:
+        """Use config."""
+        return config["configurable"]["thread_id"]
+
+    with pytest.raises(ValueError, match="injected state"):
+        ToolNode([with_state], cacheable_tools={"with_state": 60})
+    with pytest.raises(ValueError, match="RunnableConfig"):
+        ToolNode([with_config], cacheable_tools={"with_config": 60})
+    with pytest.raises(ValueError, match="unknown tool"):
+        ToolNode([lookup], cacheable_tools={"missing": 60})
+
+    node = ToolNode([lookup, flaky], cacheable_tools={"lookup": 60, "flaky": 60})
+
+    def invoke_message(*args: int) -> AIMessage:
+        return AIMessage(
+            "",
+            tool_calls=[
+                {"name": "lookup", "args": {"a": a}, "id": f"call-{i}"}
+                for i, a in enumerate(args)
+            ],
+        )
+
+    first = node.invoke({"messages": [invoke_message(1)]})["messages"]
+    second = node.invoke({"messages": [invoke_message(1, 2)]})["messages"]
+    third = (await node.ainvoke({"messages": [invoke_message(2)]}))["messages"]
+    assert calls == [1, 2]
+    assert first[0].content == second[0].content == "result 1"
+    assert third[0].content == "result 2"
+    # cached results are returned for the new tool call
+    assert [m.tool_call_id for m in second] == ["call-0", "call-1"]
+    assert third[0].tool_call_id == "call-0"
+    assert second[0] is not first[0]
+
+    # errors aren't cached
+    for _ in range(2):
+        node.invoke(
+            [AIMessage("", tool_calls=[{"name": "flaky", "args": {"a": 3}, "id": "1"}])]
+        )
+    assert calls == [1, 2, 3, 3]
+
+    # changes to a returned message don't reach the cache
+    blocks_node = ToolNode([blocks], cacheable_tools={"blocks": 60})
+    blocks_call = AIMessage(
+        "", tool_calls=[{"name": "blocks", "args": {"a": 4}, "id": "1"}]
+    )
+    for _ in range(2):
+        content = blocks_node.invoke([blocks_call])[0].content
+        assert content == [{"type": "text", "text": "result 4"}]
+        content.append({"type": "text", "text": "changed"})
+        content[0]["text"] = "changed"
+    assert calls == [1, 2, 3, 3, 4]
+
+    # expired results are recomputed
+    node.cacheable_tools["lookup"] = 0
+    node._result_cache.clear()
+    node.invoke({"messages": [invoke_message(1)]})
+    node.invoke({"messages": [invoke_message(1)]})
+    assert calls == [1, 2, 3, 3, 4, 1, 1]
+
+
+async def test_tool_node_dedupes_cacheable_tool_calls() -> None:
+    calls: list[str] = []
+
+    @dec_tool
+    def search(query: str) -> str:
+        """Search for query."""
+        calls.append(query)
+        return f"results for {query}"
+
+    @dec_tool
+    def send(to: str) -> str:
+        """Send a message."""
+        calls.append(to)
+        return "sent"
+
+    msg = AIMessage(
+        "",
+        tool_calls=[
+            {"name": "search", "args": {"query": "a"}, "id": "0"},
+            {"name": "send", "args": {"to": "b"}, "id": "1"},
+            {"name": "search", "args": {"query": "a"}, "id": "2"},
+            {"name": "send", "args": {"to": "b"}, "id": "3"},
+        ],
+    )
+    node = ToolNode([search, send], cacheable_tools={"search": 0})
+    expected = [
+        ("0", "results for a"),
+        ("1", "sent"),
+        ("2", "results for a"),
+        ("3", "sent"),
+    ]
+    outputs = node.invoke([msg])
+    assert [(m.tool_call_id, m.content) for m in outputs] == expected
+    # only calls to cacheable tools are deduplicated
+    assert sorted(calls) == ["a", "b", "b"]
+
+    calls.clear()
+    outputs = await node.ainvoke([msg])
+    assert [(m.tool_call_id, m.content) for m in outputs] == expected
+    assert sorted(calls) == ["a", "b", "b"]
+
+
+def test_args_key() -> None:
+    assert _args_key({"a": 1, "b": [1, {"c": "d"}]}) == _args_key(
+        {"b": [1, {"c": "d"}], "a": 1}
+    )
+    assert _args_key({"a": 1}) != _args_key({"a": True})
+    assert _args_key({"a": 1}) != _args_key({"a": 1.0})
+    assert _args_key({"a": 1}) != _args_key([["a", 1]])
+    assert _args_key({"a": None}) != _args_key({})
+
+
+def test_tool_node_inline_tools() -> None:
+    threads: dict[str, str] = {}
+
+    @dec_tool
+    def add(a: int, b: int) -> int:
+        """Add a and b."""
+        threads[f"add-{a}"] = threading.current_thread().name
+        return a + b
+
+    @dec_tool
+    def fetch(a: int) -> int:
+        """Fetch a."""
+        threads[f"fetch-{a}"] = threading.current_thread().name
+        return a
+
+    with pytest.raises(ValueError, match="unknown tool"):
+        ToolNode([add], inline_tools=["missing"])
+
+    node = ToolNode([add, fetch], inline_tools=["add"])
+    outputs = node.invoke(
+        [
+            AIMessage(
+                "",
+                tool_calls=[
+                    {"name": "add", "args": {"a": 1, "b": 2}, "id": "0"},
+                    {"name": "fetch", "args": {"a": 2}, "id": "1"},
+                    {"name": "add", "args": {"a": 3, "b": 4}, "id": "2"},
+                ],
+            )
+        ]
+    )
+    # results keep the order of the tool calls
+    assert [(m.tool_call_id, m.content) for m in outputs] == [
+        ("0", "3"),
+        ("1", "2"),
+        ("2", "7"),
+    ]
+    main = threading.current_thread().name
+    assert threads["add-1"] == threads["add-3"] == main
+    assert threads["fetch-2"] != main
+
+
+async def test_tool_node_max_concurrency() -> None:
+    running = 0
+    max_running = 0
+
+    @dec_tool
+    async def slow(a: int) -> int:
+        """Sleep, then return a."""
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return a
+
+    msg = AIMessage(
+        "",
+        tool_calls=[{"name": "slow", "args": {"a": i}, "id": str(i)} for i in range(6)],
+    )
+    outputs = await ToolNode([slow]).ainvoke(
+        [msg], {"configurable": {}, "max_concurrency": 2}
+    )
+    assert [m.content for m in outputs] == [str(i) for i in range(6)]
+    assert max_running == 2
+
+    max_running = 0
+    await ToolNode([slow]).ainvoke([msg])
+    assert max_running == 6
+
+
 def test_tool_node_messages_key() -> None:
     @dec_tool
     def add(a: int, b: int):